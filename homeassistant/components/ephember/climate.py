@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 from typing import Any
 
@@ -32,15 +31,16 @@ from homeassistant.const import (
     CONF_USERNAME,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import PlatformNotReady
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-_LOGGER = logging.getLogger(__name__)
+from .coordinator import EphEmberCoordinator
 
-# Return cached results if last scan was less then this time ago
-SCAN_INTERVAL = timedelta(seconds=120)
+_LOGGER = logging.getLogger(__name__)
 
 OPERATION_LIST = [HVACMode.HEAT_COOL, HVACMode.HEAT, HVACMode.OFF]
 
@@ -48,19 +48,21 @@ PLATFORM_SCHEMA = CLIMATE_PLATFORM_SCHEMA.extend(
     {vol.Required(CONF_USERNAME): cv.string, vol.Required(CONF_PASSWORD): cv.string}
 )
 
-EPH_TO_HA_STATE = {
-    "AUTO": HVACMode.HEAT_COOL,
-    "ON": HVACMode.HEAT,
-    "OFF": HVACMode.OFF,
+EPH_TO_HA_STATE: dict[ZoneMode, HVACMode] = {
+    ZoneMode.AUTO: HVACMode.HEAT_COOL,
+    ZoneMode.ON: HVACMode.HEAT,
+    ZoneMode.OFF: HVACMode.OFF,
 }
 
-HA_STATE_TO_EPH = {value: key for key, value in EPH_TO_HA_STATE.items()}
+HA_STATE_TO_EPH: dict[HVACMode, ZoneMode] = {
+    value: key for key, value in EPH_TO_HA_STATE.items()
+}
 
 
-def setup_platform(
+async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
-    add_entities: AddEntitiesCallback,
+    async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the ephember thermostat."""
@@ -68,29 +70,35 @@ def setup_platform(
     password = config.get(CONF_PASSWORD)
 
     try:
-        ember = EphEmber(username, password)
-        zones = ember.get_zones()
-        for zone in zones:
-            add_entities([EphEmberThermostat(ember, zone)])
-    except RuntimeError:
-        _LOGGER.error("Cannot connect to EphEmber")
-        return
+        ember = await hass.async_add_executor_job(EphEmber, username, password)
+    except (RuntimeError, OSError) as err:
+        raise PlatformNotReady("Cannot connect to EphEmber") from err
+
+    coordinator = EphEmberCoordinator(hass, ember)
+    await coordinator.async_refresh()
 
-    return
+    if not coordinator.last_update_success:
+        raise PlatformNotReady(
+            "Cannot connect to EphEmber"
+        ) from coordinator.last_exception
 
+    async_add_entities(
+        EphEmberThermostat(coordinator, zone) for zone in coordinator.data.values()
+    )
 
-class EphEmberThermostat(ClimateEntity):
+
+class EphEmberThermostat(CoordinatorEntity[EphEmberCoordinator], ClimateEntity):
     """Representation of a EphEmber thermostat."""
 
     _attr_hvac_modes = OPERATION_LIST
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, ember, zone):
+    def __init__(self, coordinator: EphEmberCoordinator, zone: dict[str, Any]) -> None:
         """Initialize the thermostat."""
-        self._ember = ember
+        super().__init__(coordinator)
+        self._ember = coordinator.ember
         self._zone_name = zone_name(zone)
-        self._zone = zone
         self._hot_water = zone_is_hot_water(zone)
 
         self._attr_name = self._zone_name
@@ -99,62 +107,83 @@ class EphEmberThermostat(ClimateEntity):
             ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.AUX_HEAT
         )
         self._attr_target_temperature_step = 0.5
+        self._attr_min_temp = 5.0
+        self._attr_max_temp = 35.0
         if self._hot_water:
             self._attr_supported_features = ClimateEntityFeature.AUX_HEAT
             self._attr_target_temperature_step = None
         self._attr_supported_features |= (
             ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
         )
+        self._update_attrs(zone)
 
     @property
-    def current_temperature(self):
-        """Return the current temperature."""
-        return zone_current_temperature(self._zone)
-
-    @property
-    def target_temperature(self):
-        """Return the temperature we try to reach."""
-        return zone_target_temperature(self._zone)
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        if zone_is_active(self._zone):
-            return HVACAction.HEATING
-
-        return HVACAction.IDLE
+    def _zone(self) -> dict[str, Any]:
+        """Return the latest zone data from the coordinator."""
+        return self.coordinator.data[self._zone_name]
 
     @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current operation ie. heat, cool, idle."""
-        mode = zone_mode(self._zone)
-        return self.map_mode_eph_hass(mode)
+    def available(self) -> bool:
+        """Return if the zone is still reported by EphEmber."""
+        return super().available and self._zone_name in self.coordinator.data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._zone_name in self.coordinator.data:
+            self._update_attrs(self._zone)
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self, zone: dict[str, Any]) -> None:
+        """Derive the entity state from the zone once per refresh."""
+        self._attr_hvac_action = (
+            HVACAction.HEATING if zone_is_active(zone) else HVACAction.IDLE
+        )
+        self._attr_is_aux_heat = zone_is_boost_active(zone)
+        self._attr_current_temperature = zone_current_temperature(zone)
+        self._attr_target_temperature = zone_target_temperature(zone)
+        self._attr_hvac_mode = self.map_mode_eph_hass(zone_mode(zone))
+        if self._hot_water:
+            # Hot water temp doesn't support being changed
+            self._attr_min_temp = self._attr_max_temp = self._attr_target_temperature
 
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the operation mode."""
         mode = self.map_mode_hass_eph(hvac_mode)
+        if mode == zone_mode(self._zone):
+            return
+
         if mode is not None:
-            self._ember.set_mode_by_name(self._zone_name, mode)
+            await self.hass.async_add_executor_job(
+                self._ember.set_mode_by_name, self._zone_name, mode
+            )
+            await self.coordinator.async_request_refresh()
         else:
             _LOGGER.error("Invalid operation mode provided %s", hvac_mode)
 
-    @property
-    def is_aux_heat(self):
-        """Return true if aux heater."""
-
-        return zone_is_boost_active(self._zone)
-
-    def turn_aux_heat_on(self) -> None:
+    async def async_turn_aux_heat_on(self) -> None:
         """Turn auxiliary heater on."""
-        self._ember.activate_boost_by_name(
-            self._zone_name, zone_target_temperature(self._zone)
+        if self.is_aux_heat:
+            return
+
+        await self.hass.async_add_executor_job(
+            self._ember.activate_boost_by_name,
+            self._zone_name,
+            self.target_temperature,
         )
+        await self.coordinator.async_request_refresh()
 
-    def turn_aux_heat_off(self) -> None:
+    async def async_turn_aux_heat_off(self) -> None:
         """Turn auxiliary heater off."""
-        self._ember.deactivate_boost_by_name(self._zone_name)
+        if not self.is_aux_heat:
+            return
 
-    def set_temperature(self, **kwargs: Any) -> None:
+        await self.hass.async_add_executor_job(
+            self._ember.deactivate_boost_by_name, self._zone_name
+        )
+        await self.coordinator.async_request_refresh()
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
@@ -168,35 +197,17 @@ class EphEmberThermostat(ClimateEntity):
         if temperature > self.max_temp or temperature < self.min_temp:
             return
 
-        self._ember.set_target_temperture_by_name(self._zone_name, temperature)
-
-    @property
-    def min_temp(self):
-        """Return the minimum temperature."""
-        # Hot water temp doesn't support being changed
-        if self._hot_water:
-            return zone_target_temperature(self._zone)
-
-        return 5.0
-
-    @property
-    def max_temp(self):
-        """Return the maximum temperature."""
-        if self._hot_water:
-            return zone_target_temperature(self._zone)
-
-        return 35.0
-
-    def update(self) -> None:
-        """Get the latest data."""
-        self._zone = self._ember.get_zone(self._zone_name)
+        await self.hass.async_add_executor_job(
+            self._ember.set_target_temperture_by_name, self._zone_name, temperature
+        )
+        await self.coordinator.async_request_refresh()
 
     @staticmethod
-    def map_mode_hass_eph(operation_mode):
+    def map_mode_hass_eph(operation_mode: HVACMode) -> ZoneMode | None:
         """Map from Home Assistant mode to eph mode."""
-        return getattr(ZoneMode, HA_STATE_TO_EPH.get(operation_mode), None)
+        return HA_STATE_TO_EPH.get(operation_mode)
 
     @staticmethod
-    def map_mode_eph_hass(operation_mode):
+    def map_mode_eph_hass(operation_mode: ZoneMode) -> HVACMode:
         """Map from eph mode to Home Assistant mode."""
-        return EPH_TO_HA_STATE.get(operation_mode.name, HVACMode.HEAT_COOL)
+        return EPH_TO_HA_STATE.get(operation_mode, HVACMode.HEAT_COOL)
@@ -0,0 +1,7 @@
+"""Constants for the EPH Controls Ember integration."""
+
+from datetime import timedelta
+
+DOMAIN = "ephember"
+
+SCAN_INTERVAL = timedelta(seconds=120)
@@ -0,0 +1,38 @@
+"""DataUpdateCoordinator for the EPH Controls Ember integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pyephember.pyephember import EphEmber, zone_name
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN, SCAN_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EphEmberCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Fetch all EphEmber zones with a single API call."""
+
+    def __init__(self, hass: HomeAssistant, ember: EphEmber) -> None:
+        """Initialize coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=None,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
+        self.ember = ember
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch the zones and index them by name."""
+        try:
+            zones = await self.hass.async_add_executor_job(self.ember.get_zones)
+        except (RuntimeError, OSError) as err:
+            raise UpdateFailed(f"Error communicating with EphEmber: {err}") from err
+        return {zone_name(zone): zone for zone in zones}